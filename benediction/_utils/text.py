@@ -1,25 +1,32 @@
 import typing
 
 HorizontalAlignment = typing.Literal["left", "center", "right"]
+# NOTE: center uses the format spec since str.center places odd padding differently
 _XALIGN: dict[HorizontalAlignment, typing.Callable[[typing.Iterable[str], int], list[str]]] = {
-    "left": lambda strs, width: [f"{s:<{width}}" for s in strs],
+    "left": lambda strs, width: [s.ljust(width) for s in strs],
     "center": lambda strs, width: [f"{s:^{width}}" for s in strs],
-    "right": lambda strs, width: [f"{s:>{width}}" for s in strs],
+    "right": lambda strs, width: [s.rjust(width) for s in strs],
 }
-_XSTRIP: dict[HorizontalAlignment, typing.Callable[[typing.Iterable[str]], list[str]]] = {
-    "left": lambda strs: [s.lstrip() for s in strs],
-    "center": lambda strs: [s.strip() for s in strs],
-    "right": lambda strs: [s.rstrip() for s in strs],
+_XSTRIP: dict[HorizontalAlignment, typing.Callable[[str], str]] = {
+    "left": str.lstrip,
+    "center": str.strip,
+    "right": str.rstrip,
 }
 
 
 def align(strs: typing.Iterable[str], alignment: HorizontalAlignment) -> list[str]:
     """Horizontal alignment of strings."""
-    # strip whitespace
-    strs = tuple(_XSTRIP[alignment](strs))
-    width = max(len(s) for s in strs)
+    # strip whitespace and track the widest string in a single pass
+    strip = _XSTRIP[alignment]
+    stripped: list[str] = []
+    width = 0
+    for s in strs:
+        s = strip(s)
+        if len(s) > width:
+            width = len(s)
+        stripped.append(s)
     # align each row in same width
-    return _XALIGN[alignment](strs, width)
+    return _XALIGN[alignment](stripped, width)
 
 
 def simple_wrap(strs: typing.Iterable[str], width: int, ignore_leading_whitespace: bool = True) -> list[str]:
@@ -29,15 +36,16 @@ def simple_wrap(strs: typing.Iterable[str], width: int, ignore_leading_whitespac
         if isinstance(strs, str):
             return [c for c in strs]
         return [c for str_ in strs for c in str_]
-    # build up list by exhausting flattened string
+    # build up list by scanning through flattened string (slicing only the produced lines)
     wrapped_strs = []
-    remaining_str = strs if isinstance(strs, str) else "\n".join(strs)
-    while remaining_str:
+    source = strs if isinstance(strs, str) else "\n".join(strs)
+    pos, n = 0, len(source)
+    while pos < n:
         # ignore leading whitespace after the first line
-        if wrapped_strs and (remaining_str[0] == "\n" or (ignore_leading_whitespace and remaining_str[0] == " ")):
-            wrapped_strs.append(remaining_str[1 : width + 1].replace("\n", " ") or " ")
-            remaining_str = remaining_str[width + 1 :]
+        if wrapped_strs and (source[pos] == "\n" or (ignore_leading_whitespace and source[pos] == " ")):
+            wrapped_strs.append(source[pos + 1 : pos + width + 1].replace("\n", " ") or " ")
+            pos += width + 1
         else:
-            wrapped_strs.append(remaining_str[:width].replace("\n", " "))
-            remaining_str = remaining_str[width:]
+            wrapped_strs.append(source[pos : pos + width].replace("\n", " "))
+            pos += width
     return wrapped_strs
@@ -49,6 +49,8 @@ _YDEFAULTANCHOR: dict[VerticalPosition, VerticalAnchor] = {
 # match positions to property names
 _XTOPROP: dict[HorizontalPosition, str] = {key: key.replace("-", "_") for key in _XDEFAULTANCHOR.keys()}
 _YTOPROP: dict[VerticalPosition, str] = {key: key.replace("-", "_") for key in _YDEFAULTANCHOR.keys()}
+# positions implying the outer overflow boundary
+_OUTERPOSITIONS = frozenset(key for key in (*_XDEFAULTANCHOR, *_YDEFAULTANCHOR) if key.endswith("outer"))
 
 
 @dataclass(slots=True, repr=False)
@@ -298,16 +300,17 @@ class Frame:
     @staticmethod
     def _infer_overflow_boundary(*yxs: int | float | HorizontalPosition | VerticalPosition | None) -> OverflowBoundary:
         """Infer overflow boundary from positions."""
-        # drop None params
-        yxs_ = (xy for xy in yxs if xy is not None)
-        return (
-            # assume outer boundary if all values are ints or any are explicit outer coordinates
-            "outer"
-            if (any(isinstance(xy, str) and xy.endswith("outer") for xy in yxs_))
-            or all(isinstance(xy, int) for xy in yxs_)
-            # else default to inner boundary
-            else "inner"
-        )
+        # assume outer boundary if all values are ints or any are explicit outer coordinates
+        all_ints = True
+        for xy in yxs:
+            # skip None params
+            if xy is None or isinstance(xy, int):
+                continue
+            if xy in _OUTERPOSITIONS:
+                return "outer"
+            all_ints = False
+        # else default to inner boundary
+        return "outer" if all_ints else "inner"
 
     def y(self, y: int | float | VerticalPosition, y_shift: int = 0, inner: bool = True) -> int:
         """Get vertical coordinate."""
@@ -395,6 +398,15 @@ class ConstrainedFrame:
     padding_bottom: int | float = field(default=0, kw_only=True)
     padding_left: int | float = field(default=0, kw_only=True)
     padding_right: int | float = field(default=0, kw_only=True)
+    # (margins, padding) if all are absolute, i.e. independent of outer dimensions (False if not
+    # absolute, None until the first resolution)
+    _absolute: tuple[tuple[int, int, int, int], tuple[int, int, int, int]] | typing.Literal[False] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (height_outer, width_outer, margins, padding) of latest resolution
+    _resolved: tuple[int, int, tuple[int, int, int, int], tuple[int, int, int, int]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         for attr in ("width", "height"):
@@ -475,6 +487,25 @@ class ConstrainedFrame:
             to_abs(self.padding_right, width_outer),
         )
 
+    def _resolve(self, height_outer: int, width_outer: int):
+        """Get (margins, padding) for outer height and width, reusing the latest resolution."""
+        if absolute := self._absolute:
+            return absolute
+        resolved = self._resolved
+        if resolved is not None and resolved[0] == height_outer and resolved[1] == width_outer:
+            return resolved[2], resolved[3]
+        if absolute is None:
+            # check once (on first resolution) if margins / padding are independent of outer dimensions
+            margins = (self.margin_top, self.margin_bottom, self.margin_left, self.margin_right)
+            padding = (self.padding_top, self.padding_bottom, self.padding_left, self.padding_right)
+            if all(isinstance(x, int) for x in (*margins, *padding)):
+                object.__setattr__(self, "_absolute", (margins, padding))
+                return margins, padding
+            object.__setattr__(self, "_absolute", False)
+        margins, padding = self.margins(height_outer, width_outer), self.padding(height_outer, width_outer)
+        object.__setattr__(self, "_resolved", (height_outer, width_outer, margins, padding))
+        return margins, padding
+
     def set_dimensions(
         self,
         top: int,
@@ -511,15 +542,10 @@ class ConstrainedFrame:
         if w_max is not None and width > w_max:
             raise errors.FrameConstraintError("Width violates upper bound.")
         # get margined dimensions
-        top, left, height, width = self.dimensions(top, left, height, width, height_outer, width_outer)
+        (mt, mb, ml, mr), (pt, pb, pl, pr) = self._resolve(height_outer, width_outer)
+        top, left, height, width = top + mt, left + ml, height - (mt + mb), width - (ml + mr)
         # let Frame validate dimensions
-        self.frame.set_dimensions(
-            top,
-            left,
-            height,
-            width,
-            *self.padding(height_outer, width_outer),
-        )
+        self.frame.set_dimensions(top, left, height, width, pt, pb, pl, pr)
         return top, left, height, width
 
     @classmethod
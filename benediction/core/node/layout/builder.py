@@ -16,7 +16,6 @@ class LayoutNodeFactory:
 
     _parent: LayoutNodeFactory | None
     node: LayoutNode
-    _last_added: LayoutNode | None = None
 
     def end(self):
         """End subdivision and step back in the layout hierarchy."""
@@ -32,22 +31,22 @@ class LayoutNodeFactory:
         return self._parent
 
     @property
-    def last_added(self):
-        if self._last_added is None:
+    def last_added(self) -> LayoutNode:
+        # NOTE: nodes are only ever appended to the node of the factory, so the latest addition is
+        # always the last child
+        if not (children := self.node.children):
             raise errors.LayoutError("Cannot subdivide: no Nodes have been added.")
-        return self._last_added
+        return children[-1]  # type: ignore
 
     def col(self, window: AbstractWindow | None = None, **kwargs: typing.Unpack[ColumnSpecKwargs]):
         """Add new column with fixed or dynamic width."""
-        if self.node.is_col:
+        if not self.node.is_row:
             # adding col from a col node => appending a col to the parent column (and moving back)
             self.parent.col(window, **kwargs)
             return self.parent
         else:
             # adding col from row node => append a col to the row node
-            new_col = Column(**kwargs).bind_window(window)
-            self._last_added = new_col
-            self.node.append(new_col)
+            self.node.append(Column(**kwargs).bind_window(window))
         return self
 
     def row(
@@ -62,9 +61,7 @@ class LayoutNodeFactory:
             return self.parent
         else:
             # adding row from column node => append a row to the column node
-            new_row = Row(**kwargs).bind_window(window)
-            self._last_added = new_row
-            self.node.append(new_row)
+            self.node.append(Row(**kwargs).bind_window(window))
         return self
 
     def subd(self):
@@ -75,43 +72,59 @@ class LayoutNodeFactory:
 class Layout:
     """Partitioning of a region into a responsive layout of nested rows and columns."""
 
+    __slots__ = ("_node", "_parent", "kwargs")
+    # root node (created on first subdivision)
+    _node: LayoutNode | None
+    # (optional) parent of root node
+    _parent: Node | None
+    # kwargs for root node
+    kwargs: NodeSpecKwargs
+
     def __init__(
         self,
         __parent: Node | None = None,
         **kwargs: typing.Unpack[NodeSpecKwargs],
     ):
-        self.__node = None
-        self.__parent = __parent
+        self._node = None
+        self._parent = __parent
         self.kwargs = kwargs
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.node if self.__node is not None else ''})"
+        return f"{self.__class__.__name__}({self.node if self._node is not None else ''})"
 
     def row(self, window: AbstractWindow | None = None, **kwargs: typing.Unpack[RowSpecKwargs]):
         """Subdivide layout into rows via chained methods."""
-        if self.__node is None:
-            self.__node = Column(**self.kwargs)
-            if self.__parent is not None:
-                self.__parent.append(self.__node)
-        elif self.__node.is_row:
+        if self._node is None:
+            self._node = Column(**self.kwargs)
+            if self._parent is not None:
+                self._parent.append(self._node)
+        elif self._node.is_row:
             raise errors.LayoutError("Cannot add row to row-major layout.")
         return LayoutNodeFactory(None, self.node).row(window, **kwargs)
 
     def col(self, window: AbstractWindow | None = None, **kwargs: typing.Unpack[ColumnSpecKwargs]):
         """Subdivide layout into columns via chained methods."""
-        if self.__node is None:
-            self.__node = Row(**self.kwargs)
-            if self.__parent is not None:
-                self.__parent.append(self.__node)
-        elif self.__node.is_col:
+        if self._node is None:
+            self._node = Row(**self.kwargs)
+            if self._parent is not None:
+                self._parent.append(self._node)
+        elif not self._node.is_row:
             raise errors.LayoutError("Cannot add column to column-major layout.")
         return LayoutNodeFactory(None, self.node).col(window, **kwargs)
 
     @property
     def node(self) -> LayoutNode:
-        if self.__node is None:
+        if self._node is None:
             raise errors.LayoutError("No root node in layout - add a node with 'col' or 'row' methods.")
-        return self.__node
+        return self._node
+
+    def _flat_nodes(self):
+        """Get cached flattened list of all Nodes in layout."""
+        return self.node._flat_nodes()
+
+    def _bound_windows(self):
+        """Get cached list of all bound windows in layout."""
+        return self.node._bound_windows()
 
     @property
     def order(self):
@@ -1,23 +1,50 @@
 from __future__ import annotations
 
 import typing
-from dataclasses import dataclass, field
 
 from benediction import errors
 from benediction._utils import Bounds, clip, to_abs
 from benediction.core.node.layout.solver import SpaceAllocator
 from benediction.core.node.node import Node
+from benediction.core.node.spec import NodeSpecKwargs
 
 
-@dataclass(slots=True, repr=False)
 class LayoutNode(Node):
     """Node that forms part of a row-column layout with top-down control of dimensions."""
 
-    is_row: bool = field(kw_only=True)
-    _solver: SpaceAllocator | None = field(default=None, init=False)
+    __slots__ = ("_is_row", "_solver", "_gap", "_dim_attr", "_bounds_attr")
+    _is_row: bool
+    _solver: SpaceAllocator | None
+    # axis-dependent lookups (refreshed whenever orientation changes)
+    _gap: int | float
+    _dim_attr: str
+    _bounds_attr: str
+
+    def __init__(
+        self,
+        children: list[Node] | None = None,
+        *,
+        is_row: bool,
+        spec_kwargs: NodeSpecKwargs | None = None,
+    ):
+        Node.__init__(self, children, spec_kwargs=spec_kwargs)
+        self._is_row = is_row
+        self._solver = None
+        self._orient()
 
     def __repr__(self):
-        return f"{'Row' if self.is_row else 'Column'}({', '.join([str(c) if isinstance(c, LayoutNode) else '...' for c in self.children])})"
+        return f"{'Row' if self.is_row else 'Column'}({', '.join(str(c) if isinstance(c, LayoutNode) else '...' for c in self.children)})"
+
+    @property
+    def is_row(self) -> bool:
+        return self._is_row
+
+    @is_row.setter
+    def is_row(self, is_row: bool):
+        self._is_row = is_row
+        # axis of allocation has changed, so lookups and geometries of self and ancestors are stale
+        self._orient()
+        self._invalidate_geometry()
 
     @property
     def is_col(self) -> bool:
@@ -30,89 +57,121 @@ class LayoutNode(Node):
 
     def transpose(self, depth: int = 0):
         """Flip orientation of all LayoutNodes until depth has been reached."""
-
-        def flip_orientation(node: Node):
-            if isinstance(node, LayoutNode):
-                node.is_row = not node.is_row
-
-        self.apply(flip_orientation, depth)
+        self.apply(_flip_orientation, depth)
+        # allocation of space has changed below self, so ancestors must propagate the next update
+        self._invalidate_geometry()
+
+    def _orient(self):
+        """Cache gap and constrained frame lookups along the axis of allocation."""
+        if self._is_row:
+            self._gap, self._dim_attr, self._bounds_attr = self.spec.gap_x, "width", "width_bounds"
+        else:
+            self._gap, self._dim_attr, self._bounds_attr = self.spec.gap_y, "height", "height_bounds"
 
     def update_frame(self, top: int, left: int, height: int, width: int):
         """Update the Frame dimensions of all child nodes."""
-        if self.parent:
-            p_frame = self.parent.frame
+        if (parent := self.parent) is not None:
+            p_frame = parent.cframe.frame
             height_outer, width_outer = p_frame.height_outer, p_frame.width_outer
         else:
             height_outer, width_outer = height, width
 
+        # skip update if geometry is unchanged since the latest update (and nothing was invalidated)
+        geometry = (top, left, height, width, height_outer, width_outer)
+        if geometry == self._geometry:
+            return
+        # clear geometry until update succeeds
+        self._geometry = None
+
         top, left, height, width = self.cframe.set_dimensions(top, left, height, width, height_outer, width_outer)
 
         if not self.children:
+            self._geometry = geometry
             return
 
-        start = left if self.is_row else top
-        gap = to_abs(self.spec.gap_x if self.is_row else self.spec.gap_y, width if self.is_row else height)
-        for node, space in self._allocate_space(width if self.is_row else height):
-            node.update_frame(
-                top if self.is_row else start,
-                left if self.is_col else start,
-                height if self.is_row else space,
-                width if self.is_col else space,
-            )
-            start += space + gap
-
-    def _allocate_space(self, space: int):
-        """Compute allocated space for each item and return iterator of item-space pairs."""
+        # branch on orientation once instead of per child
+        if self._is_row:
+            start, gap = left, to_abs(self._gap, width)
+            for node, space in zip(self.children, self._allocate_space(width)):
+                node.update_frame(top, start, height, space)
+                start += space + gap
+        else:
+            start, gap = top, to_abs(self._gap, height)
+            for node, space in zip(self.children, self._allocate_space(height)):
+                node.update_frame(start, left, space, width)
+                start += space + gap
+        self._geometry = geometry
+
+    def _allocate_space(self, space: int) -> list[int]:
+        """Compute allocated space for each item (in order of children)."""
         items = self.children
-        spec = self.spec
-        idx_to_space: dict[int, int] = {}
+        dim_attr, bounds_attr = self._dim_attr, self._bounds_attr
+
+        # fast path: a single unconstrained implicit item (e.g. a wrapper node) takes up all space
+        if len(items) == 1:
+            cframe = items[0].cframe
+            if getattr(cframe, dim_attr) is None and getattr(cframe, bounds_attr)(space) == (None, None):
+                if space <= 0:
+                    raise errors.InsufficientSpaceError("Failed to allocate implicit space.")
+                return [space]
+
+        spaces = [0] * len(items)
 
         allocated_space = 0
-        implicit_items: list[tuple[int, Node, Bounds]] = []
+        # indices and bounds of implicit items
+        implicit_idxs: list[int] = []
+        implicit_bounds: list[Bounds] = []
 
         # subtract gaps from space - "added back" via shifts to positions in update()
         # TODO: generalize to distribution of items (e.g. justify, left, right etc.)
-        gap = to_abs(spec.gap_x if self.is_row else spec.gap_y, space)
+        gap = to_abs(self._gap, space)
         space -= gap * max(len(items) - 1, 0)
 
         # allocate absolute and relative items
         for idx, item in enumerate(items):
             cframe = item.cframe
-            item_space = cframe.width if self.is_row else cframe.height
+            item_space = getattr(cframe, dim_attr)
             if isinstance(item_space, int):
                 # absolute is simple - no bounds, always equals assigned value
                 item_space = item_space
             else:
-                bounds = cframe.width_bounds(space) if self.is_row else cframe.height_bounds(space)
+                bounds = getattr(cframe, bounds_attr)(space)
                 # delay allocation for implicit items
                 if item_space is None:
-                    implicit_items.append((idx, item, bounds))
+                    implicit_idxs.append(idx)
+                    implicit_bounds.append(bounds)
                     continue
                 # relative may have bounds
                 item_space = clip(to_abs(item_space, space), bounds)
-            # store in dict to retain mapping to original order
-            idx_to_space[idx] = item_space
+            # store by index to retain original order
+            spaces[idx] = item_space
             allocated_space += item_space
 
         if allocated_space > space:
             raise errors.InsufficientSpaceError("Allocated more space than available.")
 
         # allocate implicit elements based on remaining space
-        if implicit_items:
-            bounds = tuple(item[2] for item in implicit_items)
+        if implicit_idxs:
+            bounds = tuple(implicit_bounds)
             remaining_space = space - allocated_space
 
             # update solver if bounds have changed
             if not self._solver or self._solver.bounds != bounds:
                 self._solver = SpaceAllocator(bounds)
 
-            # solve for the constrained distribution of integers and add results to space dict
-            implicit_items_space = self._solver.solve(remaining_space)
-            if any(item_space <= 0 for item_space in implicit_items_space):
-                raise errors.InsufficientSpaceError("Failed to allocate implicit space.")
+            # solve for the constrained distribution of integers and add results to spaces
+            for idx, item_space in zip(implicit_idxs, self._solver.solve(remaining_space)):
+                if item_space <= 0:
+                    raise errors.InsufficientSpaceError("Failed to allocate implicit space.")
+                spaces[idx] = item_space
+
+        return spaces
 
-            for i, (idx, _, _) in enumerate(implicit_items):
-                idx_to_space[idx] = implicit_items_space[i]
 
-        # return items and their allocated space for iteration
-        return zip(self.children, (idx_to_space[i] for i in range(len(items))))
+def _flip_orientation(node: Node):
+    """Flip orientation of Node if it is a LayoutNode."""
+    if isinstance(node, LayoutNode):
+        # NOTE: bypassing the setter - transpose invalidates the geometries of ancestors once
+        node._is_row = not node._is_row
+        node._orient()
+        node._geometry = None
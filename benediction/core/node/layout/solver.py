@@ -29,6 +29,8 @@ class SpaceAllocator:
     upper_bound: int | None = field(init=False, repr=False, compare=False)
     # solution table
     _table: SolutionTable = field(init=False, repr=False, compare=False)
+    # (budget, solution) of latest solve
+    _solved: tuple[int, tuple[int, ...]] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # validate constraints
@@ -108,9 +110,14 @@ class SpaceAllocator:
 
     def solve(self, budget: int):
         """Solve the integer allocation problem and return the bounded items."""
+        # reuse latest solution (e.g. when re-allocating a layout with unchanged dimensions)
+        if (solved := self._solved) is not None and solved[0] == budget:
+            return solved[1]
         x = self._solve_x(budget)
         allocations = self.evaluate(x)
-        return _distribute_integers(allocations)
+        solution = _distribute_integers(allocations)
+        object.__setattr__(self, "_solved", (budget, solution))
+        return solution
 
 
 def _flatten_bounds(bounds: BoundSequence) -> list[tuple[int, bool]]:
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import typing
 from abc import ABC, abstractmethod
-from dataclasses import InitVar, dataclass, field
+from collections import deque
+from itertools import islice
 
 from benediction import errors
 from benediction.core.frame import ConstrainedFrame
@@ -11,33 +12,63 @@ from benediction.core.window import AbstractWindow
 from benediction.style.style import Style, WindowStyleKwargs
 
 
-@dataclass(slots=True, repr=False)
 class Node(ABC):
     """Object that forms part of a hierarchy of relations to parent and child Nodes."""
 
+    __slots__ = (
+        "parent",
+        "children",
+        "spec",
+        "cframe",
+        "_cached_style",
+        "_window",
+        "_child_ids",
+        "_flattened",
+        "_windows",
+        "_geometry",
+    )
     # relational nodes
-    parent: Node | None = field(default=None, init=False)
-    children: list[Node] = field(default_factory=list)
+    parent: Node | None
+    children: list[Node]
     # NodeSpec governing styling, constraints on frames and allocation of space to child Nodes
-    spec: NodeSpec = field(init=False)
-    spec_kwargs: InitVar[NodeSpecKwargs | None] = field(default=None, kw_only=True)
+    spec: NodeSpec
     # constrained frame
-    cframe: ConstrainedFrame = field(init=False, repr=False)
+    cframe: ConstrainedFrame
     # caching style to get inheritance at access-time + avoid recursively deriving Styles
-    _cached_style: Style | None = field(default=None, init=False)
+    _cached_style: Style | None
     # window mapped to Node frame
-    _window: AbstractWindow | None = field(default=None, init=False)
-
-    def __post_init__(self, spec_kwargs: NodeSpecKwargs | None):
-        # set spec and frame
-        spec_kwargs = {} if spec_kwargs is None else spec_kwargs
-        self.spec = NodeSpec.from_kwargs(**spec_kwargs)
-        self.cframe = ConstrainedFrame.from_spec(self.spec)
+    _window: AbstractWindow | None
+    # ids of child Nodes for constant-time membership tests
+    _child_ids: set[int]
+    # flattened hierarchy cached for repeated traversals (invalidated on structural changes)
+    _flattened: list[Node] | None
+    # bound windows of flattened hierarchy (invalidated on structural changes and window binding)
+    _windows: list[AbstractWindow] | None
+    # arguments of latest frame update (None => Frame must be updated, e.g. after structural changes)
+    _geometry: tuple[int, ...] | None
+
+    def __init__(self, children: list[Node] | None = None, *, spec_kwargs: NodeSpecKwargs | None = None):
+        self.parent = None
+        # copy children so removing them from an old parent never mutates a shared list
+        self.children = [] if children is None else list(children)
+        # set spec and frame (sharing the default spec when no kwargs are given)
+        if not spec_kwargs:
+            self.spec = NodeSpec.default
+            self.cframe = ConstrainedFrame()
+        else:
+            self.spec = NodeSpec.from_kwargs(**spec_kwargs)
+            self.cframe = ConstrainedFrame.from_spec(self.spec)
+        self._cached_style = None
+        self._window = None
+        self._flattened = None
+        self._windows = None
+        self._geometry = None
         # pop nodes from (potential) old parents
         _move_parents(self, self.children)
+        self._child_ids = {id(node) for node in self.children}
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({', '.join([str(c) for c in self.children])})"
+        return f"{self.__class__.__name__}({', '.join(str(c) for c in self.children)})"
 
     @typing.overload
     def __getitem__(self, __i: typing.SupportsIndex) -> Node:
@@ -52,8 +83,7 @@ class Node(ABC):
 
     def __contains__(self, node: Node):
         # compare by id (i.e. by memory - NOT equality) - use with caution
-        node_id = id(node)
-        return any(node_id == id(child) for child in self.children)
+        return id(node) in self._child_ids
 
     @property
     def frame(self):
@@ -66,7 +96,7 @@ class Node(ABC):
         # NOTE: caching allows for inheriting at access time and protects us against exponential
         # growth in recursively inheriting from parent Nodes (at the cost of dealing with
         # invalidation when styles change)
-        if (cached_style := getattr(self, "_cached_style", None)) is not None:
+        if (cached_style := self._cached_style) is not None:
             return cached_style
         # construct Style from spec if not found in cache
         parent_style = self.parent.style if self.parent is not None else None
@@ -80,50 +110,112 @@ class Node(ABC):
         # update style kwargs in spec
         self.spec = self.spec.update_style(**kwargs)
         # invalidate all cached styles (that may have derived from replaced Style)
-        self.apply(lambda node: delattr(node, "_cached_style"))
+        for node in self._flat_nodes():
+            node._cached_style = None
         # assign updated style to window
         if self._window:
             self._window.set_style(self.style)
         return self
 
+    def _warm_styles(self):
+        """Derive and cache Styles of self and all child Nodes."""
+        # parents precede their children in the (pre-ordered) flattened hierarchy, so every Style
+        # is derived from an already cached parent Style
+        for node in self._flat_nodes():
+            node.style
+
     def append(self, node: Node):
         """Append a new child Node."""
         self.extend(node)
 
     def extend(self, *nodes: Node):
         """Append new child Nodes."""
-        if any(node in self.children for node in nodes):
+        child_ids = self._child_ids
+        if any(id(node) in child_ids for node in nodes):
             raise errors.NodeError("Cannot append Node: is already a child.")
         # remove from old parents and extend child list
         _move_parents(self, nodes)
         self.children.extend(nodes)
+        child_ids.update(id(node) for node in nodes)
+        self._invalidate_structure()
 
     def pop(self, __index: typing.SupportsIndex = -1):
         """Pop a child Node."""
         node = self.children.pop(__index)
         node.parent = None
+        self._child_ids.discard(id(node))
+        self._invalidate_structure()
         return node
 
     def apply(self, fn: typing.Callable[[Node], typing.Any], depth: int = -1, to_self: bool = True):
         """Apply function to (optional) self and all child Nodes recursively."""
+        # iterative pre-order traversal over (node, remaining depth) pairs - avoids a Python frame
+        # per node (and the recursion limit on deep hierarchies)
         if to_self:
-            fn(self)
-        # break on 0 depth => continue indefinitely if depth<0
-        if depth == 0:
+            stack = deque(((self, depth),))
+        elif depth != 0:
+            stack = deque((child, depth - 1) for child in self.children)
+        else:
             return
-        # apply to every child at decremented depth
-        for child in self.children:
-            child.apply(fn, depth - 1)
+        popleft, extendleft = stack.popleft, stack.extendleft
+        while stack:
+            node, depth_ = popleft()
+            fn(node)
+            # break on 0 depth => continue indefinitely if depth<0
+            if depth_ != 0:
+                extendleft((child, depth_ - 1) for child in reversed(node.children))
 
     def flatten(self, depth: int = -1, include_self: bool = True):
         """Get flattened list of child Nodes."""
-        nodes = []
-        self.apply(lambda node: nodes.append(node), depth, include_self)
-        return nodes
+        nodes: list[Node] = []
+        # iterative pre-order traversal over (node, remaining depth) pairs - avoids a function call
+        # per node (and the recursion limit on deep hierarchies)
+        stack = deque(((self, depth),))
+        # bind methods to locals to skip attribute lookups in the loop
+        append, popleft, extendleft = nodes.append, stack.popleft, stack.extendleft
+        while stack:
+            node, depth_ = popleft()
+            append(node)
+            # break on 0 depth => continue indefinitely if depth<0
+            if depth_ != 0:
+                extendleft((child, depth_ - 1) for child in reversed(node.children))
+        return nodes if include_self else nodes[1:]
+
+    def _flat_nodes(self) -> list[Node]:
+        """Get cached flattened list of self and all child Nodes (must NOT be mutated)."""
+        if (flattened := self._flattened) is None:
+            flattened = self._flattened = self.flatten()
+        return flattened
+
+    def _bound_windows(self) -> list[AbstractWindow]:
+        """Get cached list of bound windows of self and all child Nodes (must NOT be mutated)."""
+        if (windows := self._windows) is None:
+            windows = self._windows = [w for node in self._flat_nodes() if (w := node._window) is not None]
+        return windows
+
+    def _invalidate_structure(self):
+        """Invalidate cached flattened hierarchies, windows and geometries of self and all parent Nodes."""
+        # NOTE: an ancestor may hold a cache even when its descendants do not, so there is no
+        # early exit - but the walk is only as long as the depth of the Node
+        node: Node | None = self
+        while node is not None:
+            node._flattened = None
+            node._windows = None
+            node._geometry = None
+            node = node.parent
+
+    def _invalidate_geometry(self):
+        """Invalidate cached geometries of self and all parent Nodes (forcing a frame update)."""
+        node: Node | None = self
+        while node is not None:
+            node._geometry = None
+            node = node.parent
 
     def bind_window(self, window: AbstractWindow | None):
         """Bind AbstractWindow to Node."""
         self._window = window
+        # new window must be included in cached windows and initialized on next frame update
+        self._invalidate_structure()
         self.frame.bind_window(window)
         if window:
             window.bind_frame(self.frame)
@@ -152,23 +244,24 @@ class Node(ABC):
 
     def noutrefresh(self):
         """Refresh Node window if bound."""
-        if not self._window is None:
-            self.window.noutrefresh()
+        if (window := self._window) is not None:
+            window.noutrefresh()
 
     def clear(self):
         """Clear Node window if bound."""
-        if not self._window is None:
-            self.window.clear()
+        if (window := self._window) is not None:
+            window.clear()
 
 
 # NOTE: this node type is mainly intended for building "last-depth" components, i.e. nodes that have
 # a small / static number of children - layouts should be built with LayoutNodes, which uses a
 # top-down approach to allocation of frames (defining available space at the root node) instead of a
 # bottoms-up approach that relies on explicitly setting frame dimensions on child nodes
-@dataclass(slots=True, repr=False)
 class ContainerNode(Node):
     """Node object with dimensions dictated by its children."""
 
+    __slots__ = ()
+
     def update_frame(
         self,
         top: int | None = None,
@@ -180,24 +273,17 @@ class ContainerNode(Node):
         # NOTE: this is a bottoms-up approach - basically, assume the child nodes have dealt with
         # their frames explicitly and infer the boundary from them, ignoring all constraints (since
         # we are not working relative to an outer frame)
-        right, bottom = None, None
-
-        def update_boundaries(node: Node):
-            nonlocal top, left, right, bottom
-            frame = node.frame
-            # update running top/left/right/bottom boundaries
-            if frame.is_ready:
-                top = frame.top_abs if top is None or frame.top_abs < top else top
-                left = frame.left_abs if left is None or frame.left_abs < left else left
-                right = frame.right_abs if right is None or frame.right_abs > right else right
-                bottom = frame.bottom_abs if bottom is None or frame.bottom_abs > bottom else bottom
-
-        # update boundaries from recursion through child nodes
-        self.apply(update_boundaries, to_self=False)
-        width = width if right is None or left is None else (right - left) + 1
-        height = height if top is None or bottom is None else (bottom - top) + 1
-
-        if not any((top is None, left is None, width is None, height is None)):
+        frames = [frame for node in islice(self._flat_nodes(), 1, None) if (frame := node.cframe.frame).is_ready]
+        if frames:
+            # update boundaries to the extremes of all (ready) child frames
+            top_ = min(frame.top_abs for frame in frames)
+            left_ = min(frame.left_abs for frame in frames)
+            top = top_ if top is None or top_ < top else top
+            left = left_ if left is None or left_ < left else left
+            width = max(frame.right_abs for frame in frames) - left + 1
+            height = max(frame.bottom_abs for frame in frames) - top + 1
+
+        if top is not None and left is not None and width is not None and height is not None:
             # update inner frame directly (ignoring constraints)
             self.cframe.frame.set_dimensions(top, left, height, width)  # type: ignore
         else:
@@ -208,20 +294,37 @@ def _move_parents(new_parent: Node, children: typing.Sequence[Node]):
     """Move children from their old parent Node to a new parent Node."""
     # NOTE: using ids should be okay to use as proxy for unique objects here since it shouldn't be
     # possible for any of these objects to not stay alive (and have their ids replaced)
-    old_parent_to_children: dict[int, list[int]] = {}
-    old_parents: list[Node] = []
-    # iterating over nodes followed by (unique) parents => only one assignment per parent
+    moved: list[tuple[Node, Node]] = []
     for node in children:
         if (old_parent := node.parent) is not None:
-            # add to dict
-            if (parent_id := id(old_parent)) not in old_parent_to_children:
-                old_parent_to_children[parent_id] = [id(node)]
-                old_parents.append(old_parent)
-            else:
-                old_parent_to_children[parent_id].append(id(node))
+            moved.append((old_parent, node))
         # update parent of reassigned node
         node.parent = new_parent
-    # remove ids from parents
+    # fast path: no old parents (e.g. freshly constructed nodes)
+    if not moved:
+        return
+    old_parent_to_children: dict[int, list[int]] = {}
+    old_parents: list[Node] = []
+    # grouping nodes by (unique) parents => only one assignment per parent
+    for old_parent, node in moved:
+        if (parent_id := id(old_parent)) not in old_parent_to_children:
+            old_parent_to_children[parent_id] = [id(node)]
+            old_parents.append(old_parent)
+        else:
+            old_parent_to_children[parent_id].append(id(node))
+    # remove ids from parents (in place)
     for old_parent in old_parents:
-        removed_ids = set(old_parent_to_children[id(old_parent)])
-        old_parent.children = [node for node in old_parent.children if id(node) not in removed_ids]
+        siblings = old_parent.children
+        if len(removed := old_parent_to_children[id(old_parent)]) == 1:
+            # single node moved from parent => delete by index without rebuilding the list
+            removed_id = removed[0]
+            for i, node in enumerate(siblings):
+                if id(node) == removed_id:
+                    del siblings[i]
+                    break
+            old_parent._child_ids.discard(removed_id)
+        else:
+            removed_ids = set(removed)
+            siblings[:] = [node for node in siblings if id(node) not in removed_ids]
+            old_parent._child_ids -= removed_ids
+        old_parent._invalidate_structure()
@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import typing
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 
 from benediction.style.style import Style, WindowStyleKwargs
 
@@ -84,6 +87,7 @@ class NodeSpecKwargs(BaseNodeSpecKwargs, RowKwargs, ColumnKwargs):
 class NodeSpec:
     """Attributes related to Node styling and spacing constraints."""
 
+    default: typing.ClassVar[NodeSpec]
     # style
     base_style: Style | typing.Literal["default", "parent"]  # style to derive from
     style_kwargs: WindowStyleKwargs
@@ -108,19 +112,41 @@ class NodeSpec:
     padding_bottom: int | float
     padding_left: int | float
     padding_right: int | float
+    # (top, bottom, left, right) tuples inferred from margins / padding
+    _margins: tuple[int | float, int | float, int | float, int | float] = field(init=False, repr=False, compare=False)
+    _padding: tuple[int | float, int | float, int | float, int | float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # spec is frozen, so tuples can be constructed once
+        margins = self.margin_top, self.margin_bottom, self.margin_left, self.margin_right
+        padding = self.padding_top, self.padding_bottom, self.padding_left, self.padding_right
+        object.__setattr__(self, "_margins", margins)
+        object.__setattr__(self, "_padding", padding)
 
     @property
     def margins(self):
         """Get (top, bottom, left, right) margin parameters."""
-        return self.margin_top, self.margin_bottom, self.margin_left, self.margin_right
+        return self._margins
 
     @property
     def padding(self):
         """Get (top, bottom, left, right) padding parameters."""
-        return self.padding_top, self.padding_bottom, self.padding_left, self.padding_right
+        return self._padding
+
+    @classmethod
+    def from_kwargs(cls, **kwargs: typing.Unpack[NodeSpecKwargs]) -> NodeSpec:
+        """Get NodeSpec from keyword arguments (shared between identical arguments)."""
+        # NOTE: NodeSpecs are frozen, so instances can safely be shared - types are part of the key
+        # since e.g. 1 == 1.0 but integers are absolute and floats are relative units
+        try:
+            key = frozenset((k, type(v), v) for k, v in kwargs.items())
+        except TypeError:
+            # unhashable argument values => construct without cache
+            return cls._from_kwargs(**kwargs)
+        return _cached_from_kwargs(key)
 
     @classmethod
-    def from_kwargs(
+    def _from_kwargs(
         cls,
         # height
         h: int | float | None = None,
@@ -164,18 +190,18 @@ class NodeSpec:
             width_min=min_w,
             width_max=max_w,
             # gaps
-            gap_x=_prioritize(gap_x, gap, default=0),
-            gap_y=_prioritize(gap_y, gap, default=0),
+            gap_x=gap_x if gap_x is not None else gap if gap is not None else 0,
+            gap_y=gap_y if gap_y is not None else gap if gap is not None else 0,
             # margins with priority given to most specific keyword
-            margin_top=_prioritize(mt, my, m, default=0),
-            margin_bottom=_prioritize(mb, my, m, default=0),
-            margin_left=_prioritize(ml, mx, m, default=0),
-            margin_right=_prioritize(mr, mx, m, default=0),
+            margin_top=mt if mt is not None else my if my is not None else m if m is not None else 0,
+            margin_bottom=mb if mb is not None else my if my is not None else m if m is not None else 0,
+            margin_left=ml if ml is not None else mx if mx is not None else m if m is not None else 0,
+            margin_right=mr if mr is not None else mx if mx is not None else m if m is not None else 0,
             # padding with priority given to most specific keyword
-            padding_top=_prioritize(pt, py, p, default=0),
-            padding_bottom=_prioritize(pb, py, p, default=0),
-            padding_left=_prioritize(pl, px, p, default=0),
-            padding_right=_prioritize(pr, px, p, default=0),
+            padding_top=pt if pt is not None else py if py is not None else p if p is not None else 0,
+            padding_bottom=pb if pb is not None else py if py is not None else p if p is not None else 0,
+            padding_left=pl if pl is not None else px if px is not None else p if p is not None else 0,
+            padding_right=pr if pr is not None else px if px is not None else p if p is not None else 0,
             # style
             base_style=base_style,
             style_kwargs=style_kwargs,
@@ -188,18 +214,22 @@ class NodeSpec:
     ):
         """Return new NodeSpec with replaced Style options."""
         base_style = self.base_style if base_style is None else base_style
-        derived_kwargs = {k: (getattr(self.style_kwargs, k) if v is None else v) for k, v in style_kwargs.items()}
+        # merge with existing kwargs (None values retain the existing value)
+        derived_kwargs = {**self.style_kwargs, **{k: v for k, v in style_kwargs.items() if v is not None}}
         return replace(self, base_style=base_style, style_kwargs=derived_kwargs)
 
     def derive_style(self, parent_style: Style | None = None):
         """Derive Style object from NodeSpec."""
-        base_style = Style.default if (self.base_style == "default" or parent_style is None) else parent_style
+        base_style = self.base_style
+        if isinstance(base_style, str):
+            # named base style (parent falls back to default at the root)
+            base_style = parent_style if base_style == "parent" and parent_style is not None else Style.default
         return base_style.derive(**self.style_kwargs)
 
 
-def _prioritize(*args, default):
-    """Return first not-None arg or the default value."""
-    for arg in args:
-        if arg is not None:
-            return arg
-    return default
+@lru_cache(maxsize=512)
+def _cached_from_kwargs(kwargs: frozenset[tuple[str, type, typing.Any]]):
+    return NodeSpec._from_kwargs(**{k: v for k, _, v in kwargs})
+
+
+NodeSpec.default = NodeSpec.from_kwargs()
@@ -36,7 +36,9 @@ class Screen:
         # NOTE: screen window is cleared manually since it's the root (not cleared by layouts)
         self.stdscr.clear()
         for layout in self.layouts:
-            layout.node.apply(lambda node: node.clear())
+            for node in layout._flat_nodes():
+                node.clear()
+                node._geometry = None
 
     def refresh(self):
         """Refresh screen."""
@@ -47,7 +49,8 @@ class Screen:
         # NOTE: screen window is refreshed manually since it's the root (not refreshed by layouts)
         self.stdscr.noutrefresh()
         for layout in self.layouts:
-            layout.node.apply(lambda node: node.noutrefresh())
+            for window in layout._bound_windows():
+                window.noutrefresh()
 
     def update(self):
         """Update screen window and all layouts based on current screen size."""
@@ -56,6 +59,7 @@ class Screen:
         self.node.update_frame()
         for layout in self.layouts:
             layout.node.update_frame(0, 0, height, width)
+            layout.node._warm_styles()
 
     def new_layout(self, **kwargs: typing.Unpack[NodeSpecKwargs]):
         """Return a new layout with the ScreenNode as its parent."""
@@ -112,10 +116,11 @@ class Screen:
         return self._node
 
 
-@dataclass(slots=True, repr=False)
 class ScreenNode(Node):
     """Root Node of an Application containing a reference to the global ScreenWindow."""
 
+    __slots__ = ()
+
     def update_frame(self, *args, **kwargs):
         # no args - screen always represents all available space
         height, width = self.window.internal.getmaxyx()
@@ -35,7 +35,20 @@ class TextWrapKwargs(typing.TypedDict):
     tabsize: typing.NotRequired[int]
 
 
-@dataclass
+# TextWrapper instances reused across calls (keyed by kwargs - width is set per call)
+_text_wrappers: dict[frozenset, textwrap.TextWrapper] = {}
+
+
+def _text_wrapper(width: int, kwargs: TextWrapKwargs) -> textwrap.TextWrapper:
+    """Get cached TextWrapper for kwargs with width set."""
+    key = frozenset(kwargs.items())
+    if (wrapper := _text_wrappers.get(key)) is None:
+        wrapper = _text_wrappers[key] = textwrap.TextWrapper(**kwargs)
+    wrapper.width = width
+    return wrapper
+
+
+@dataclass(slots=True)
 class AbstractWindow(ABC):
     """Container class managing the dimenions of a curses window."""
 
@@ -108,6 +121,9 @@ class AbstractWindow(ABC):
         **kwargs: typing.Unpack[StyleKwargs],
     ):
         """Handle prioritization of style-related arguments and return integer representation of style."""
+        # fast path for the common case of no style arguments
+        if attr is None and style is None and not kwargs:
+            return self._style.attr
         if attr is not None:
             if kwargs or style:
                 raise ValueError("Cannot use explicit 'attr' together with style arguments.")
@@ -161,8 +177,12 @@ class AbstractWindow(ABC):
         # apply attribute to each row of region
         num = max(to_x_ - from_x_ + 1, 0)
         attr = self.get_attr(style, attr, **style_kwargs)
+        # skip curses calls for empty (e.g. fully clipped) regions
+        if num == 0:
+            return
+        chgat = self.internal.chgat
         for y in range(from_y_, to_y_ + 1):
-            self.internal.chgat(y, from_x_, num, attr)
+            chgat(y, from_x_, num, attr)
 
     def print(
         self,
@@ -193,19 +213,26 @@ class AbstractWindow(ABC):
         # compute base coordinates
         inner_x = clip_overflow_x != "outer"
         inner_y = clip_overflow_y != "outer"
-        y_: int = f.y(y, inner_y) + f.y(y_shift, inner_y)
-        x_: int = f.x(x, inner_x) + f.x(x_shift, inner_x)
+        # NOTE: integer coordinates and shifts are absolute, so Frame resolution can be bypassed
+        y_: int = y if isinstance(y, int) else f.y(y, inner=inner_y)
+        if y_shift:
+            y_ += y_shift if isinstance(y_shift, int) else f.y(y_shift, inner=inner_y)
+        x_: int = x if isinstance(x, int) else f.x(x, inner=inner_x)
+        if x_shift:
+            x_ += x_shift if isinstance(x_shift, int) else f.x(x_shift, inner=inner_x)
 
         # get anchors
         y_anchor = f.y_anchor(y)
         x_anchor = f.x_anchor(x)
 
         # infer wrapping method from other parameters
-        wrap = wrap if wrap is not None else "simple" if isinstance(str_, str) or wrap_width is not None else False
+        is_str = isinstance(str_, str)
+        if wrap is None:
+            wrap = "simple" if is_str or wrap_width is not None else False
 
         if wrap:
             if wrap_width is None:
-                if not isinstance(str_, str):
+                if not is_str:
                     raise ValueError("Cannot cannot infer wrap width unless argument is a string.")
                 # infer wrap width s.t. lines wrap at point of horizontal overflow
                 elif x_anchor == "center":
@@ -234,30 +261,23 @@ class AbstractWindow(ABC):
                     # ...
                     #
                     # with x being the position, L/R the left/right char limit and W the width
-                    r = f.right_outer if x_anchor.endswith("outer") else f.right
-                    l = f.left_outer if x_anchor.endswith("outer") else f.left
                     wrap_width = min(
-                        2 * (x_ - l) + 1,
-                        2 * (r - x_),
+                        2 * (x_ - f.left) + 1,
+                        2 * (f.right - x_),
                     )
                 elif x_anchor == "right":
-                    l = f.left_outer if x_anchor.endswith("outer") else f.left
-                    wrap_width = x_ - l + 1
+                    wrap_width = x_ - f.left + 1
                 else:
-                    r = f.right_outer if x_anchor.endswith("outer") else f.right
-                    wrap_width = r - x_ + 1
+                    wrap_width = f.right - x_ + 1
                 wrap_width = max(wrap_width, 1)
             # apply wrap to (sequence of) strings
             if wrap == "textwrap":
+                # NOTE: isinstance (rather than is_str) narrows the type of str_ for type checkers
                 if not isinstance(str_, str):
                     raise ValueError("Cannot wrap non-string with 'textwrap': use 'simple'.")
                 elif not str_ or str_.isspace():
                     raise ValueError("Cannot apply 'textwrap' to whitespace string: use 'simple'.")
-                strs = textwrap.wrap(
-                    str_,
-                    wrap_width,
-                    **textwrap_kwargs,
-                )
+                strs = _text_wrapper(wrap_width, textwrap_kwargs).wrap(str_)
             else:
                 strs = text.simple_wrap(str_, wrap_width)
         elif isinstance(str_, str):
@@ -272,24 +292,26 @@ class AbstractWindow(ABC):
             strs = text.align(strs, alignment)
 
         # compute anchors
-        strs_height, strs_width = len(strs), max(len(s) for s in strs)
+        strs_height, strs_width = len(strs), max(map(len, strs))
         y_ = f.anchor_y(y_, strs_height, y_anchor)
         x_ = f.anchor_x(x_, strs_width, x_anchor)
 
         # handle y overflow
         top_clip, bottom_clip = 0, None
         if clip_overflow_y:
-            top_clip = max((f.top if clip_overflow_y == "inner" else f.top_outer) - y_, 0)
-            bottom_clip = max((f.bottom if clip_overflow_y == "inner" else f.bottom_outer) - y_ + 1, 0)
-        elif not (ignore_overflow or (0 <= y_ <= f.height_outer - len(strs))):
+            t, b = (f.top, f.bottom) if clip_overflow_y == "inner" else (f.top_outer, f.bottom_outer)
+            top_clip = t - y_ if t > y_ else 0
+            bottom_clip = b - y_ + 1 if b >= y_ else 0
+        elif not (ignore_overflow or (0 <= y_ <= f.height_outer - strs_height)):
             raise errors.WindowOverflowError()
 
         # handle x overflow
         left_clip, right_clip = 0, None
         if clip_overflow_x:
-            left_clip = max((f.left if clip_overflow_x == "inner" else f.left_outer) - x_, 0)
-            right_clip = max((f.right if clip_overflow_x == "inner" else f.right_outer) - x_ + 1, 0)
-        elif not (ignore_overflow or 0 <= x_ <= f.width_outer - max(len(s) for s in strs)):
+            l, r = (f.left, f.right) if clip_overflow_x == "inner" else (f.left_outer, f.right_outer)
+            left_clip = l - x_ if l > x_ else 0
+            right_clip = r - x_ + 1 if r >= x_ else 0
+        elif not (ignore_overflow or 0 <= x_ <= f.width_outer - strs_width):
             raise errors.WindowOverflowError()
 
         # shift base coordinates by overflow
@@ -325,7 +347,7 @@ class AbstractWindow(ABC):
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class Window(AbstractWindow):
     def noutrefresh(self):
         if self._internal:
@@ -345,7 +367,7 @@ class Window(AbstractWindow):
         return self
 
 
-@dataclass
+@dataclass(slots=True)
 class Pad(AbstractWindow):
     content: typing.Sequence[str] | None = None
     # content dimensions
@@ -380,11 +402,17 @@ class Pad(AbstractWindow):
     def init(self):
         # we use max values to ensure that the pad does not underflow the normal dimensions
         height, width = self.frame.height_outer, self.frame.width_outer
-        self._internal = curses.newpad(max(self.content_height, height), max(self.content_width, width))
+        pad_width = max(self.content_width, width)
+        self._internal = curses.newpad(max(self.content_height, height), pad_width)
         # add content
         if self.content is not None:
-            for i, line in enumerate(self.content):
-                self._internal.addstr(i, 0, line)
+            if self.content_width < pad_width:
+                # write content in a single call when no line fills the pad width (curses would
+                # otherwise wrap the cursor to the next line before the newline is written)
+                self._internal.addstr(0, 0, "\n".join(self.content))
+            else:
+                for i, line in enumerate(self.content):
+                    self._internal.addstr(i, 0, line)
         return self
 
     def resize(self):
@@ -449,7 +477,7 @@ class Pad(AbstractWindow):
         return self.content_width - 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrollingPad(Pad):
     """Pad that keeps shifted position in the (vertical) middle of window area."""
 
@@ -471,7 +499,7 @@ class ScrollingPad(Pad):
 
 
 # TODO (?): restructure to root ScreenNode (with bound window / frame by default)
-@dataclass
+@dataclass(slots=True)
 class ScreenWindow(Window):
     def init(self, *args, **kwargs):
         self._internal = curses.initscr()
@@ -1,7 +1,4 @@
-from abc import ABC
-
-
-class BenedictionError(Exception, ABC):
+class BenedictionError(Exception):
     ...
 
 
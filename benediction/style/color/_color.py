@@ -3,11 +3,14 @@ from __future__ import annotations
 import curses
 import typing
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from benediction import errors
 from benediction.style.color import tailwind, x11
 
 RGB = tuple[int, int, int]
+# mapping of 0-255 color values to the 0-1000 range used by curses
+_CURSES_SCALE: tuple[int, ...] = tuple((x * 1_000) // 255 for x in range(256))
 
 
 # subclassing as int to enable passing instances directly as curses attr args
@@ -55,13 +58,16 @@ class ColorFactory:
             curses.use_default_colors()
             cls.default = Color(-1, None, None, None)  # type: ignore
         # add new color (or reinitialize it if color has been replaced)
-        if rgb not in cls.__colors or cls.number - cls.__colors[rgb].number > curses.COLORS:
+        color = cls.__colors.get(rgb)
+        if color is None or cls.number - color.number > curses.COLORS:
+            if not (0 <= red <= 255 and 0 <= green <= 255 and 0 <= blue <= 255):
+                raise errors.ColorError(f"Invalid color {rgb}: values must be between 0 and 255.")
             cls.number += 1
             color = Color(cls.number, *rgb)
             cls.__colors[rgb] = color
             # init new color definition (mapping 0-255 to curses range 0-1000)
-            curses.init_color(int(color), *[(x * 1_000) // 255 for x in rgb])
-        return cls.__colors[rgb]
+            curses.init_color(int(color), _CURSES_SCALE[red], _CURSES_SCALE[green], _CURSES_SCALE[blue])
+        return color
 
     @classmethod
     def tw(cls, color: tailwind.Color) -> Color:
@@ -79,7 +85,7 @@ class ColorFactory:
         shades: typing.Sequence[tailwind.Shade] = (50, 100, 200, 300, 400, 500, 600, 700, 800, 900),
     ) -> tuple[Color, ...]:
         """Get shades of named Tailwind color."""
-        return tuple(cls.tw(f"{name}-{shade}") for shade in shades)  # type: ignore
+        return tuple(cls.tw(color) for color in _tw_shades(name, tuple(shades)))
 
     @classmethod
     def x11(cls, color: x11.Color) -> Color:
@@ -97,22 +103,29 @@ class ColorPairFactory:
     number: int = 0
 
     def __new__(cls, foreground: Color | RGB, background: Color | RGB):
-        # retrieve colors
-        if isinstance(foreground, tuple):
+        # retrieve colors (identity check first since Colors are the common case)
+        if foreground.__class__ is not Color and isinstance(foreground, tuple):
             foreground = ColorFactory(*foreground)
-        if isinstance(background, tuple):
+        if background.__class__ is not Color and isinstance(background, tuple):
             background = ColorFactory(*background)
         # NOTE: need to start pair number from 1 due to 0 being reserved for white-on-black
         pair_key = (foreground, background)
         # add new pair (or reinitialize it if pair has been replaced)
-        if pair_key not in cls.__pairs or cls.number - cls.__pairs[pair_key].number > curses.COLOR_PAIRS:
+        color_pair = cls.__pairs.get(pair_key)
+        if color_pair is None or cls.number - color_pair.number > curses.COLOR_PAIRS:
             cls.number += 1
             color_pair = ColorPair(cls.number, foreground, background)
             cls.__pairs[pair_key] = color_pair
             # NOTE: cannot use int(color_pair) - this gives the attr representation, NOT the pair number
             pair_number = cls.number % curses.COLOR_PAIRS + 1
             curses.init_pair(pair_number, foreground, background)
-        return cls.__pairs[pair_key]
+        return color_pair
+
+
+@lru_cache(maxsize=256)
+def _tw_shades(name: tailwind.Name, shades: tuple[tailwind.Shade, ...]) -> tuple[tailwind.Color, ...]:
+    """Get names of shades of named Tailwind color."""
+    return tuple(f"{name}-{shade}" for shade in shades)  # type: ignore
 
 
 def reset_colors():
@@ -56,7 +56,7 @@ def _bitor(xs: typing.Iterable[int]):
     return value
 
 
-def _default_to_parent(parent: Style, **kwargs):
+def _default_to_parent(parent: Style, kwargs: typing.Mapping[str, typing.Any]):
     return {k: (getattr(parent, k) if v is None else v) for k, v in kwargs.items()}
 
 
@@ -193,25 +193,29 @@ class Style:
 
     @property
     def attr(self) -> int:
-        if self.fg is not None and self.bg is not None:
-            return ColorPairFactory(self.fg, self.bg) | self._flag_attr
-        elif self.fg is not None and self.bg is None:
-            return self.fg.fg | self._flag_attr
-        elif self.bg is not None and self.fg is None:
-            return self.bg.bg | self._flag_attr
-        else:
+        fg, bg = self.fg, self.bg
+        # check colorless case first (e.g. the default style)
+        if fg is None and bg is None:
             return self._flag_attr
+        elif bg is None:
+            return fg.fg | self._flag_attr  # type: ignore
+        elif fg is None:
+            return bg.bg | self._flag_attr
+        else:
+            return ColorPairFactory(fg, bg) | self._flag_attr
 
     @property
     def win_attr(self) -> int:
-        if self.win_fg is not None and self.win_bg is not None:
-            return ColorPairFactory(self.win_fg, self.win_bg) | self._win_flag_attr
-        elif self.win_fg is not None and self.win_bg is None:
-            return self.win_fg.fg | self._win_flag_attr
-        elif self.win_bg is not None and self.win_fg is None:
-            return self.win_bg.bg | self._win_flag_attr
-        else:
+        fg, bg = self.win_fg, self.win_bg
+        # check colorless case first (e.g. the default style)
+        if fg is None and bg is None:
             return self._win_flag_attr
+        elif bg is None:
+            return fg.fg | self._win_flag_attr  # type: ignore
+        elif fg is None:
+            return bg.bg | self._win_flag_attr
+        else:
+            return ColorPairFactory(fg, bg) | self._win_flag_attr
 
     def derive(self, **kwargs: typing.Unpack[WindowStyleKwargs]):
         """Create new Style derived from existing fields that are not replaced."""
@@ -226,7 +230,7 @@ class Style:
                     kwargs[key] = ColorFactory.tw(color)  # type: ignore
                 elif isinstance(color, tuple):
                     kwargs[key] = ColorFactory(*color)
-        return replace(self, **_default_to_parent(self, **kwargs))
+        return replace(self, **_default_to_parent(self, kwargs))
 
 
 Style.default = Style()
@@ -117,3 +117,23 @@ def test_constraints(implicit_constraints, exact_constraints):
     ConstrainedFrame(**{**exact_constraints, "width": w}).set_dimensions(
         0, 0, const_h, int(w * outer_w), outer_h, outer_w
     )
+
+
+def test_resolution_cache(implicit_constraints):
+    cframe = ConstrainedFrame(**implicit_constraints)
+    frame = cframe.frame
+
+    # repeated assignment with same outer dimensions yields same dimensions
+    first = cframe.set_dimensions(0, 0, h_min, w_min, 20, 50)
+    assert cframe.set_dimensions(0, 0, h_min, w_min, 20, 50) == first
+    assert first[0] == int(mt * 20) and frame.padding_right == int(pr * 50)
+
+    # relative margins / padding are resolved again when outer dimensions change
+    second = cframe.set_dimensions(0, 0, h_min, w_min, 40, 100)
+    assert second[0] == int(mt * 40) and frame.padding_right == int(pr * 100)
+
+    # absolute margins / padding are independent of outer dimensions
+    cframe = ConstrainedFrame(margin_top=2, margin_left=1, padding_right=3)
+    assert cframe.set_dimensions(0, 0, 10, 10, 20, 50) == (2, 1, 8, 9)
+    assert cframe.set_dimensions(0, 0, 10, 10, 40, 100) == (2, 1, 8, 9)
+    assert cframe.frame.padding_right == 3
@@ -180,3 +180,19 @@ def test_overflow_clip(dims):
     ys = (-h, t - 1, h // 2, h + 34, t + h + 2, t + h // 4, h + 2, h - 5)
     assert not all(frame.top_outer <= y <= frame.bottom_outer for y in ys)
     assert all(frame.top_outer <= y <= frame.bottom_outer for y in frame.clip_y(*ys, boundary="outer"))
+
+
+def test_infer_overflow_boundary():
+    infer = Frame._infer_overflow_boundary
+    # absolute coordinates use outer boundary
+    assert infer(3) == "outer"
+    assert infer(3, None) == "outer"
+    assert infer(None) == "outer"
+    # named positions and relative coordinates use inner boundary
+    assert infer("left") == "inner"
+    assert infer(0.5) == "inner"
+    assert infer(3, "top") == "inner"
+    # unless any position is explicitly outer
+    assert infer("top-outer") == "outer"
+    assert infer("left", "right-outer") == "outer"
+    assert infer(0.5, "bottom-outer") == "outer"
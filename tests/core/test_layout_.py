@@ -1,6 +1,7 @@
 import pytest
 
 from benediction.core.node import Column, Row
+from benediction.style import Style
 
 
 @pytest.fixture
@@ -46,3 +47,27 @@ def test_style_inheritance(styled_nodes):
     styled_nodes.update_style(italic=False, blink=True)
     assert not styled_nodes.style.italic and styled_nodes.style.blink
     assert not styled_nodes[0].style.italic and styled_nodes[0].style.blink and styled_nodes[0].style.bold
+
+    # consecutive updates without accessing styles in between
+    styled_nodes.update_style(blink=True)
+    styled_nodes.update_style(blink=False)
+    assert not styled_nodes.style.blink and not styled_nodes[0].style.blink
+
+    # updates are merged with existing style kwargs (None retains the existing value)
+    styled_nodes.update_style(bold=True)
+    styled_nodes.update_style(underline_mode=True, bold=None)
+    assert styled_nodes.style.bold and styled_nodes.style.underline_mode
+    assert not styled_nodes.style.italic and not styled_nodes.style.blink
+
+
+def test_warm_styles(styled_nodes):
+    # warming derives and caches the styles of all nodes
+    styled_nodes._warm_styles()
+    assert all(node._cached_style is not None for node in styled_nodes.flatten())
+    assert styled_nodes[0][1].style.italic and styled_nodes[0][1].style.bold
+
+
+def test_explicit_base_style():
+    # explicit base styles are derived from instead of the parent style
+    root = Row([Column(base_style=Style(underline_mode=True), bold=True)], italic=True)
+    assert root[0].style.underline_mode and root[0].style.bold and not root[0].style.italic
@@ -304,3 +304,49 @@ def test_bounds():
             # row 2
             assert layout[2].frame.width == width
             assert check_dimensions(layout[2], height - layout[0].frame.height - layout[1].frame.height, width)
+
+
+def test_incremental_update():
+    layout = Layout()
+    layout.row().row()
+    layout.node.update_frame(0, 0, 50, 20)
+    assert [n.frame.height for n in layout] == [25, 25]
+
+    # structural changes are propagated on the next update with unchanged dimensions
+    layout.row()
+    layout.node.update_frame(0, 0, 50, 20)
+    assert sorted(n.frame.height for n in layout) == [16, 17, 17]
+
+    # as are changes in orientation
+    layout.node.transpose(-1)
+    layout.node.update_frame(0, 0, 50, 20)
+    assert sorted(n.frame.width for n in layout) == [6, 7, 7]
+    assert all(n.frame.height == 50 for n in layout)
+
+    # assigning the orientation directly is equivalent to transposing the node
+    layout = Layout()
+    layout.row().row()
+    layout.node.update_frame(0, 0, 50, 20)
+    layout.node.is_row = True
+    layout.node.update_frame(0, 0, 50, 20)
+    assert [n.frame.width for n in layout] == [10, 10]
+    layout = Layout()
+    layout.row(w=5).row()
+    layout.node.is_row = True
+    layout.node.update_frame(0, 0, 50, 21)
+    assert [n.frame.width for n in layout] == [5, 16]
+
+
+def test_single_child():
+    layout = Layout()
+    layout.row().subd().col()
+    layout.node.update_frame(0, 0, 30, 40)
+    # single implicit items take up all available space
+    assert layout[0].frame.height == 30
+    assert layout[0][0].frame.width == 40
+
+    # bounded items are still allocated by the solver (which cannot leave space unallocated)
+    layout = Layout()
+    layout.row().subd().col(max_w=20)
+    with pytest.raises(errors.SolverError):
+        layout.node.update_frame(0, 0, 30, 40)
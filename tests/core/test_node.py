@@ -2,6 +2,7 @@ import pytest
 
 from benediction import errors
 from benediction.core.node import ContainerNode
+from benediction.core.window import Window
 
 
 @pytest.fixture
@@ -69,6 +70,22 @@ def test_apply(nodes):
     nodes.apply(increment)
     assert i == 10
 
+    # nodes are visited in the same (pre-)order as flatten
+    visited = []
+    nodes.apply(visited.append)
+    assert [id(n) for n in visited] == [id(n) for n in nodes.flatten()]
+    visited = []
+    nodes.apply(visited.append, 1, to_self=False)
+    assert [id(n) for n in visited] == [id(nodes[0]), id(nodes[1])]
+
+
+def test_deep_hierarchy():
+    # traversal is not limited by the recursion limit
+    node = ContainerNode()
+    for _ in range(5_000):
+        node = ContainerNode([node])
+    assert len(node.flatten()) == 5_001
+
 
 def test_flatten(nodes):
     # flattened node has expected number of elements
@@ -76,6 +93,12 @@ def test_flatten(nodes):
     assert len(nodes.flatten(1)) == 3
     assert len(nodes.flatten(2)) == 8
     assert len(nodes.flatten(3)) == 10
+    # excluding self drops the root but keeps depth relative to it
+    assert len(nodes.flatten(0, include_self=False)) == 0
+    assert len(nodes.flatten(1, include_self=False)) == 2
+    assert len(nodes.flatten(include_self=False)) == 9
+    # nodes are flattened in pre-order
+    assert [id(n) for n in nodes.flatten()[:4]] == [id(nodes), id(nodes[0]), id(nodes[0][0]), id(nodes[0][1])]
 
 
 def test_update_frame(sized_nodes):
@@ -188,6 +211,12 @@ def test_parent_removal():
     with pytest.raises(errors.NodeError):
         parent_2.append(child_0_2)
 
+    # passing the children of another node moves them without emptying the new node
+    parent_3 = ContainerNode(parent_2.children)
+    assert len(parent_3.children) == 4
+    assert all(node.parent is parent_3 for node in parent_3.children)
+    assert parent_2.children == []
+
 
 def test_pop():
     parent_0 = ContainerNode(
@@ -213,3 +242,46 @@ def test_pop():
 
     parent_1.append(popped_node)
     assert p_0_node_1 in parent_1
+
+
+def test_default_spec():
+    node_0, node_1 = ContainerNode(), ContainerNode()
+    # default spec is shared between nodes...
+    assert node_0.spec is node_1.spec
+    # ...but frames are never shared
+    assert node_0.cframe.frame is not node_1.cframe.frame
+    node_0.cframe.frame.set_dimensions(0, 0, 5, 5)
+    assert not node_1.frame.is_ready
+
+
+def test_flat_nodes_cache(nodes):
+    # cached flattened list matches flatten and is reused while structure is unchanged
+    flat_nodes = nodes._flat_nodes()
+    assert [id(n) for n in flat_nodes] == [id(n) for n in nodes.flatten()]
+    assert nodes._flat_nodes() is flat_nodes
+
+    # appending to a nested node invalidates the caches of its ancestors
+    nodes[1][1].append(new_node := ContainerNode())
+    assert new_node in nodes._flat_nodes()
+    assert len(nodes._flat_nodes()) == 11
+
+    # moving a node to another parent invalidates the old parent hierarchy
+    ContainerNode([nodes[0]])
+    assert len(nodes._flat_nodes()) == 7
+
+    # popping a node invalidates the hierarchy
+    nodes[0].pop(0)
+    assert len(nodes._flat_nodes()) == 6
+
+
+def test_bound_windows_cache(nodes):
+    assert nodes._bound_windows() == []
+
+    # binding a window to a nested node invalidates the caches of its ancestors
+    nodes[1][0].bind_window(window := Window())
+    assert nodes._bound_windows() == [window]
+    assert nodes._bound_windows() is nodes._bound_windows()
+
+    # as does removing the node from the hierarchy
+    nodes[1].pop(0)
+    assert nodes._bound_windows() == []
@@ -0,0 +1,33 @@
+from benediction.core.screen import Screen, ScreenNode
+from benediction.core.window import ScreenWindow
+
+
+class _StubScreen:
+    """Stand-in for the curses standard screen with a fixed size."""
+
+    def getmaxyx(self):
+        return 40, 20
+
+    def bkgd(self, *args):
+        pass
+
+
+def _screen():
+    screen = Screen()
+    window = ScreenWindow()
+    window._internal = _StubScreen()  # type: ignore
+    screen._node = ScreenNode().bind_window(window)
+    return screen
+
+
+def test_update_after_layout_change():
+    screen = _screen()
+    layout = screen.new_layout()
+    layout.row()
+    screen.update()
+    assert [n.frame.height for n in layout.node.children] == [40]
+
+    # layout changes are picked up on the next update even if the screen size is unchanged
+    layout.row()
+    screen.update()
+    assert [n.frame.height for n in layout.node.children] == [20, 20]
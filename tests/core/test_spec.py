@@ -0,0 +1,30 @@
+from benediction.core.node.spec import NodeSpec
+
+
+def test_prioritization():
+    # unspecified spacing defaults to 0
+    spec = NodeSpec.from_kwargs()
+    assert spec.margins == (0, 0, 0, 0)
+    assert spec.padding == (0, 0, 0, 0)
+    assert spec.gap_x == spec.gap_y == 0
+
+    # most specific keyword takes priority
+    spec = NodeSpec.from_kwargs(m=1, my=2, mt=3, p=0.1, px=4, pr=5, gap=1, gap_y=2)
+    assert spec.margins == (3, 2, 1, 1)
+    assert spec.padding == (0.1, 0.1, 4, 5)
+    assert spec.gap_x == 1 and spec.gap_y == 2
+
+    # explicit zeros are not skipped
+    spec = NodeSpec.from_kwargs(m=1, mt=0, gap=1, gap_x=0)
+    assert spec.margins == (0, 1, 1, 1)
+    assert spec.gap_x == 0 and spec.gap_y == 1
+
+
+def test_shared_specs():
+    # identical kwargs (in any order) give the same (frozen) spec
+    assert NodeSpec.from_kwargs(m=1, bold=True) is NodeSpec.from_kwargs(bold=True, m=1)
+    assert NodeSpec.from_kwargs() is NodeSpec.default
+    assert NodeSpec.from_kwargs(m=1) is not NodeSpec.from_kwargs(m=2)
+    # equal values of different types are not shared
+    assert NodeSpec.from_kwargs(m=1).margin_top == 1
+    assert isinstance(NodeSpec.from_kwargs(m=1.0).margin_top, float)
@@ -0,0 +1,74 @@
+from benediction.core.frame import Frame
+from benediction.core.window import Window
+
+
+class _RecordingWindow:
+    """Stand-in for a curses window that records printed rows."""
+
+    def __init__(self):
+        self.rows: list[tuple[int, int, str]] = []
+
+    def addstr(self, y: int, x: int, str_: str, attr: int):
+        self.rows.append((y, x, str_))
+
+
+def _window():
+    frame = Frame()
+    frame.set_dimensions(0, 0, 10, 20, padding_top=1, padding_bottom=1, padding_left=2, padding_right=2)
+    window = Window().bind_frame(frame)
+    window._internal = internal = _RecordingWindow()  # type: ignore
+    return window, internal
+
+
+def test_print_position():
+    window, internal = _window()
+    f = window.frame
+
+    # integer coordinates are printed at exactly the given position
+    window.print("a", y=3, x=4, attr=0)
+    # named and relative positions resolve against the inner frame...
+    window.print("b", y="top", x="left", attr=0)
+    window.print("c", y=0.0, x=0.0, attr=0)
+    # ...or the outer frame for outer positions and when clipping to the outer boundary
+    window.print("d", y="top-outer", x="left-outer", attr=0)
+    window.print("e", y=0.0, x=0.0, clip_overflow_y="outer", clip_overflow_x="outer", attr=0)
+    # integer shifts move the position by exactly the given amount (also for named positions)
+    window.print("f", y="top", x="left", y_shift=2, x_shift=1, attr=0)
+    window.print("g", y=3, x=4, y_shift=2, x_shift=1, attr=0)
+
+    assert internal.rows == [
+        (3, 4, "a"),
+        (f.top, f.left, "b"),
+        (f.top, f.left, "c"),
+        (f.top_outer, f.left_outer, "d"),
+        (f.top_outer, f.left_outer, "e"),
+        (f.top + 2, f.left + 1, "f"),
+        (5, 5, "g"),
+    ]
+
+
+def test_print_clipping():
+    window, internal = _window()
+    f = window.frame
+    rows = ["x" * 30] * 12
+
+    # named and relative positions clip to the inner frame by default
+    window.print(rows, y="top", x="left", attr=0)
+    assert len(internal.rows) == f.height
+    assert all(len(row) == f.width for _, _, row in internal.rows)
+
+    internal.rows.clear()
+    window.print(rows, y=0.0, x=0.0, attr=0)
+    assert len(internal.rows) == f.height
+    assert internal.rows[0] == (f.top, f.left, "x" * f.width)
+
+    # integer and outer positions clip to the outer frame
+    internal.rows.clear()
+    window.print(rows, y=0, x=0, attr=0)
+    assert len(internal.rows) == f.height_outer
+    assert internal.rows[0] == (f.top_outer, f.left_outer, "x" * f.width_outer)
+
+    internal.rows.clear()
+    window.print(rows, y="top-outer", x="left", attr=0)
+    assert len(internal.rows) == f.height_outer
+    assert internal.rows[0] == (f.top_outer, f.left, "x" * f.width)
@@ -294,6 +294,13 @@ def test_hash():
     assert SpaceAllocator(bounds[0]) != SpaceAllocator(bounds[1])
 
 
+def test_repeated_solve():
+    # repeated solves with the same and different budgets match fresh solutions
+    solver = SpaceAllocator(((5, 10), (5, 10), (10, 30)))
+    for budget in (50, 50, 40, 30, 30, 50):
+        assert solver.solve(budget) == solve(((5, 10), (5, 10), (10, 30)), budget)
+
+
 def test_simple():
     # testing for some simple hardcoded cases with "simple" solutions
     assert solve(((None, None),), 100) == (100,)